@@ -1,7 +1,12 @@
+import os
 import sqlite3
+import threading
+from collections import Counter
+from itertools import chain
+from contextlib import contextmanager
+from functools import lru_cache
 from configparser import ConfigParser, NoSectionError, ParsingError
 import logging
-import re
 
 """
 This module provides a helper class for working with SQLite databases using a configuration file (.ini) 
@@ -17,8 +22,36 @@ Example INI format:
 An asterisk (*) denotes the column is part of the primary key.
 """
 
+_log = logging.getLogger(__name__)
 
-def _load_config(filename, section):
+_JOURNAL_MODES = {'DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'}
+
+# Default SQLITE_MAX_VARIABLE_NUMBER (999 before SQLite 3.32), used when the connection cannot report
+# its own limit, and the cap on rows per multi-row INSERT.
+_MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+_MAX_ROWS_PER_INSERT = 500
+
+_VALID_IDENTIFIERS: set[str] = set()
+
+# Connections shared by every SQLiteHelper pointed at the same database file, with open-helper counts.
+_POOL: dict[str, sqlite3.Connection] = {}
+_REFS: Counter[str] = Counter()
+# On-disk connections backing pooled in-memory databases, keyed like _POOL.
+_DISK: dict[str, sqlite3.Connection] = {}
+# Per-connection locks serializing statements (and whole transaction() blocks) across threads.
+_LOCKS: dict[str, threading.RLock] = {}
+# Guards _POOL, _REFS, _DISK and _LOCKS.
+_POOL_LOCK = threading.Lock()
+
+_SQL_TEMPLATES = {
+    'min': 'SELECT MIN({column}) FROM {table}',
+    'max': 'SELECT MAX({column}) FROM {table}',
+    'avg': 'SELECT AVG({column}) FROM {table}',
+    'count': 'SELECT COUNT(*) as total FROM {table}',
+}
+
+
+def _load_config(filename: str, section: str) -> dict[str, str]:
     """Load the configuration section from an INI file."""
 
     parser = ConfigParser()
@@ -35,41 +68,103 @@ def _load_config(filename, section):
          raise NoSectionError(f'Section {section} not found in the {filename} file')
 
 
-def _parse_table_config(input_config):
-    """Parse the INI table structure into a list of (column_def, is_primary_key) tuples."""
-    return_list = []
-    for key, value in input_config.items():
-        return_list.append((f'{key.replace("*", "")} {value}', key[0] == '*'))
-    return return_list
+def _parse_table_config(input_config: dict[str, str]) -> list[tuple[str, str, bool]]:
+    """Parse the INI table structure into a list of (column_name, column_type, is_primary_key) tuples."""
+    return [(key[1:] if key.startswith('*') else key, value, key.startswith('*'))
+            for key, value in input_config.items()]
+
+
+@lru_cache(maxsize=32)
+def _load_and_parse(filename: str, section: str) -> tuple[tuple[str, str, bool], ...]:
+    """
+    Load and parse a table section from an INI file, memoized per (filename, section).
+
+    The INI file is only read the first time a given section is requested; later edits to the file
+    are not picked up until the process restarts or _load_and_parse.cache_clear() is called.
+    """
+
+    return tuple(_parse_table_config(_load_config(filename, section)))
+
+
+@lru_cache(maxsize=128)
+def _select_sql(table: str, selection_items: tuple[str, ...], selection_where: str | None = None) -> str:
+    """Build (and memoize) the SELECT statement for a column tuple and optional WHERE clause."""
 
+    query = f'SELECT {", ".join(selection_items)} FROM {table}'
+    if selection_where:
+        query += f' WHERE {selection_where}'
+    return query
 
-def __sanitize_identifier(identifier):
+
+@lru_cache(maxsize=64)
+def _compile(kind: str, table: str, column: str | None = None) -> str:
+    """Build (and memoize) the SQL text for one of the fixed per-method query shapes."""
+
+    return _SQL_TEMPLATES[kind].format(table=table, column=column)
+
+
+def _open_connection(path: str, pragmas: str,
+                     in_memory: bool) -> tuple[sqlite3.Connection, sqlite3.Connection | None]:
+    """
+    Open and configure a new connection to a database file.
+
+    Returns the connection to use and, for in_memory databases, the on-disk connection backing it.
+    Nothing is left open if setup fails.
+    """
+
+    conn = sqlite3.connect(path, check_same_thread=False, cached_statements=256)
+    disk = None
+    try:
+        conn.executescript(pragmas)
+        if in_memory:
+            disk, conn = conn, sqlite3.connect(':memory:', check_same_thread=False, cached_statements=256)
+            disk.backup(conn)
+            conn.executescript(pragmas)
+        conn.row_factory = sqlite3.Row
+        return conn, disk
+
+    except BaseException:
+        conn.close()
+        if disk is not None:
+            disk.close()
+        raise
+
+
+def _sanitize_identifier(identifier: str) -> str:
     """Helper function to assist with detecting SQL Injection."""
 
-    if not re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', identifier):
+    if identifier in _VALID_IDENTIFIERS:
+        return identifier
+
+    # An ASCII Python identifier is exactly [A-Za-z_][A-Za-z0-9_]*, checked without the regex engine.
+    if not (identifier.isascii() and identifier.isidentifier()):
         raise ValueError(f"Invalid identifier: {identifier}")
+    _VALID_IDENTIFIERS.add(identifier)
     return identifier
 
 
 class SQLiteHelper:
 
-    def __init__(self, db_file, db_name, enable_command_logging=False):
+    def __init__(self, db_file, db_name, enable_command_logging=False, journal_mode='WAL', cache_mib=64,
+                 in_memory=False):
+        self.conn = None
         try:
-            self.__config = _load_config(db_file, db_name)
-            self.__config_list = _parse_table_config(self.__config)
-            self.__establish_db_conn(db_name)
+            self.__config_list = _load_and_parse(db_file, db_name)
+            # ConfigParser lower-cases option names; SQLite column names are case-insensitive.
+            self.__columns = frozenset(name for name, _, _ in self.__config_list)
+            self.__establish_db_conn(db_name, journal_mode, cache_mib, in_memory)
             self.db_name = db_name
             self.debug = enable_command_logging
             self.__create_table()
 
         except NoSectionError as e:
-            logging.error(f'Error occurred. Missing section header for {db_file}. \n{e}')
+            _log.error('Error occurred. Missing section header for %s. \n%s', db_file, e)
 
         except ParsingError as e:
-            logging.error(f'Parsing error for {db_file}. \n{e}')
+            _log.error('Parsing error for %s. \n%s', db_file, e)
 
         except Exception as e:
-            logging.error(f'Unhandled error: {e}')
+            _log.error('Unhandled error: %s', e)
 
     def __enter__(self):
         return self
@@ -77,146 +172,387 @@ class SQLiteHelper:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.__close()
 
-    def __create_table(self):
-        """Create the database table if it does not already exist."""
+    @contextmanager
+    def transaction(self):
+        """
+        Group several operations into a single transaction.
 
-        table_name = self.db_name
-        table_layout = self.__config_list
+        Statements executed inside the block are not committed individually; the whole block is
+        committed on exit, or rolled back if an exception escapes it.
 
-        __command_string__ = f"""CREATE TABLE IF NOT EXISTS {table_name} ("""
-        primary_key_fields = []
+        Helpers opened on the same database file share one connection, so the transaction belongs
+        to that connection rather than to this helper: writes made on the same thread through any
+        other helper for the file are part of it and are rolled back with it. Other threads wait
+        until the block finishes.
 
+        Example:
+            with helper.transaction():
+                for row in rows:
+                    helper.insert_data(columns, row)
+        """
 
-        for line in table_layout:
-            __command_string__ += f'{line[0]}, '
-            if line[1]:  
-                primary_key_fields.append(line[0].split(' ')[0])
+        with self.__lock:
+            self.cursor.execute('BEGIN IMMEDIATE')
+            try:
+                yield self
+            except BaseException:
+                self.conn.rollback()
+                raise
+            else:
+                self.conn.commit()
 
-        if primary_key_fields:  
-            __command_string__ += f'PRIMARY KEY ({", ".join(primary_key_fields)})'
-        else:
-            __command_string__ = __command_string__.rstrip(', ')
+    def __create_table(self):
+        """Create the database table if it does not already exist."""
+
+        table_layout = self.__config_list
 
-        __command_string__ += ')'  
+        column_defs = [f'{name} {column_type}' for name, column_type, _ in table_layout]
+        primary_key_fields = [name for name, _, is_primary_key in table_layout if is_primary_key]
+        if primary_key_fields:
+            column_defs.append(f'PRIMARY KEY ({", ".join(primary_key_fields)})')
+
+        __command_string__ = f'CREATE TABLE IF NOT EXISTS {self.db_name} ({", ".join(column_defs)})'
 
         try:
-            self.cursor.execute(__command_string__)
-            self.conn.commit()
+            with self.__lock:
+                self.cursor.execute(__command_string__)
+                self.conn.commit()
 
         except sqlite3.OperationalError as se:
-            if self.debug: logging.error(f'Exception Occurred: {se}')
+            if self.debug: _log.error('Exception Occurred: %s', se)
+
+    def __establish_db_conn(self, db_name, journal_mode='WAL', cache_mib=64, in_memory=False):
+        """
+        Establish a connection to the SQLite database and apply performance pragmas.
 
-    def __establish_db_conn(self, db_name):
-        """Establish a connection to the SQLite database."""
+        Helpers for the same database file share one pooled connection; the pragmas and in_memory mode
+        are applied when that connection is first opened.
 
-        self.conn = sqlite3.connect(f'{db_name}.db')
-        self.conn.row_factory = sqlite3.Row
+        Args:
+            db_name (str): Name of the database file (without the .db extension).
+            journal_mode (str, optional): SQLite journal mode. WAL pairs with synchronous=NORMAL;
+                any other mode keeps synchronous=FULL for strict durability.
+            cache_mib (int, optional): Page cache size in MiB.
+            in_memory (bool, optional): Load the database file into a :memory: database and work on that
+                copy. Changes reach the file only through snapshot() and when the last helper closes.
+        """
+
+        journal_mode = journal_mode.upper()
+        if journal_mode not in _JOURNAL_MODES:
+            raise ValueError(f"Invalid journal mode: {journal_mode}")
+        synchronous = 'NORMAL' if journal_mode == 'WAL' else 'FULL'
+
+        self.__db_path = os.path.abspath(f'{db_name}.db')
+        with _POOL_LOCK:
+            conn = _POOL.get(self.__db_path)
+            if conn is None:
+                pragmas = f"""
+                    PRAGMA journal_mode={journal_mode};
+                    PRAGMA synchronous={synchronous};
+                    PRAGMA temp_store=MEMORY;
+                    PRAGMA mmap_size=10737418240;
+                    PRAGMA cache_size=-{int(cache_mib) * 1024};
+                    PRAGMA busy_timeout=3000;
+                """
+                conn, disk = _open_connection(self.__db_path, pragmas, in_memory)
+                _POOL[self.__db_path] = conn
+                _LOCKS[self.__db_path] = threading.RLock()
+                if disk is not None:
+                    _DISK[self.__db_path] = disk
+            _REFS[self.__db_path] += 1
+            self.__lock = _LOCKS[self.__db_path]
+        self.conn = conn
         self.cursor = self.conn.cursor()
 
     def __close(self):
-        """Used to close connection to SQLite DB"""
-        if self.conn:
-            self.conn.close()
+        """Used to release the connection to SQLite DB; it is closed once no other helper is using it."""
+        if not self.conn:
+            return
+
+        conn, self.conn = self.conn, None
+        with _POOL_LOCK:
+            if _POOL.get(self.__db_path) is not conn:
+                # Not pooled, e.g. an in-memory database kept after its final snapshot failed.
+                conn.close()
+                return
+
+            _REFS[self.__db_path] -= 1
+            if _REFS[self.__db_path] > 0:
+                return
+            del _REFS[self.__db_path]
+            del _POOL[self.__db_path]
+            del _LOCKS[self.__db_path]
+
+            disk = _DISK.pop(self.__db_path, None)
+            if disk is not None:
+                try:
+                    if conn.in_transaction:
+                        raise sqlite3.OperationalError('a transaction is still open')
+                    conn.backup(disk, pages=1000)
+                except sqlite3.Error as e:
+                    # Keep the in-memory database reachable rather than discarding its data.
+                    self.conn = conn
+                    disk.close()
+                    _log.error('Final snapshot of %s failed; in-memory data is still on conn. Error: %s',
+                               self.__db_path, e)
+                    return
+                conn.close()
+                conn = disk
+
+            try:
+                # Cheap when statistics are fresh; refreshes them when queries would benefit.
+                conn.execute('PRAGMA optimize')
+            except sqlite3.Error:
+                pass
+            finally:
+                conn.close()
+
+    def snapshot(self) -> tuple[str, bool]:
+        """
+        Persist an in_memory database to its file.
+
+        Committed changes are copied to disk; without in_memory the data already lives on disk and
+        this is a no-op.
 
-    def __execute_query(self, query, params=None) -> tuple[list[dict], bool]:
+        Returns:
+            tuple[str, bool]: Success or failure message. Bool for success/failure
+        """
+
+        disk = _DISK.get(self.__db_path)
+        if disk is None:
+            return "Database is not in memory; nothing to snapshot.", True
+
+        # backup() retries forever while the source has an open write transaction.
+        if self.conn.in_transaction:
+            if self.debug: _log.error('Snapshot failed. Error: a transaction is still open')
+            return 'Snapshot failed. Error: a transaction is still open; commit it first.', False
+
+        try:
+            with self.__lock:
+                self.conn.backup(disk, pages=1000)
+            if self.debug: _log.info('Snapshot written successfully.')
+            return "Snapshot written successfully.", True
+
+        except Exception as e:
+            if self.debug: _log.error('Snapshot failed. Error: %s', e)
+            return f'Snapshot failed. Error: {e}', False
+
+    def __execute_query(self, query, params=None, as_dicts=False) -> tuple[list, bool]:
         """
         Execute a SQL query with optional parameters.
 
         Args:
             query (str): SQL query to execute.
             params (tuple, optional): Values to bind to query placeholders.
+            as_dicts (bool, optional): Convert each row to a dict instead of returning sqlite3.Row objects.
 
         Returns:
-            list[dict]: Query results as a list of dictionaries (rows), or an empty list on error.
+            tuple[list, bool]: Query results as a list of rows (sqlite3.Row, or dict when as_dicts is set),
+                or an empty list on error. Bool for success/failure
         """
 
-        try:
-            if params is not None:
-                if self.debug:
-                    logging.info(f'Attempting to execute:'
-                             f'Query - {query}'
-                             f'Params - {params}')
+        with self.__lock:
+            # Reads have nothing to commit or roll back; only writes outside an open transaction do.
+            autocommit = not self.conn.in_transaction and query.lstrip()[:6].upper() != 'SELECT'
+            try:
+                if params is not None:
+                    if self.debug:
+                        _log.info('Attempting to execute: Query - %s Params - %s', query, params)
+
+                    self.cursor.execute(query, params)
+                else:
+                    if self.debug:
+                        _log.info('Attempting to execute: Query - %s', query)
+                    self.cursor.execute(query)
+                if autocommit:
+                    self.conn.commit()
+                result = self.cursor.fetchall()
+
+            except Exception as e:
+                if autocommit:
+                    self.conn.rollback()
+                if self.debug: _log.error('Exception occurred, rolled back any changes. Error: %s', e)
+                return [], False
 
-                self.cursor.execute(query, params)
-            else:
-                if self.debug:
-                    logging.info(f'Attempting to execute:'
-                             f'Query - {query}')
-                self.cursor.execute(query)
-            self.conn.commit()
-            result = self.cursor.fetchall()
-            return [dict(row) for row in result], True
+        if as_dicts:
+            return list(map(dict, result)), True
+        return result, True
 
-        except Exception as e:
-            self.conn.rollback()
-            if self.debug: logging.error(f'Exception occurred, rolled back any changes. Error: {e}')
-            return [], False
+    def iter_query(self, query, params=None, chunk_size=1000):
+        """
+        Execute a SQL query and stream its rows instead of loading the whole result set.
+
+        Rows are fetched from SQLite chunk_size at a time on a dedicated cursor, so other helper calls
+        made while iterating do not disturb the stream.
+
+        Args:
+            query (str): SQL query to execute.
+            params (tuple, optional): Values to bind to query placeholders.
+            chunk_size (int, optional): Number of rows fetched per round trip.
+
+        Yields:
+            sqlite3.Row: Each result row.
+        """
+
+        if self.debug:
+            _log.info('Attempting to execute: Query - %s Params - %s', query, params)
+        cursor = self.conn.cursor()
+        cursor.arraysize = chunk_size
+        try:
+            # The lock is only held while talking to SQLite, never across a yield.
+            with self.__lock:
+                cursor.execute(query, params or ())
+            while True:
+                with self.__lock:
+                    rows = cursor.fetchmany()
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    def __exec(self, query, params=()):
+        """
+        Execute a write statement with bound parameters and return the cursor.
+
+        Commits immediately unless a transaction (e.g. a transaction() block) is already open. On
+        failure the change is rolled back (outside a transaction) and the exception is re-raised for
+        the caller to report.
+        """
 
-    def select_data(self, selection_items: tuple[str, ...], selection_where=None) -> tuple[list[dict], bool]:
+        if self.debug:
+            _log.info('Attempting to execute: Query - %s Params - %s', query, params)
+        with self.__lock:
+            in_transaction = self.conn.in_transaction
+            try:
+                cursor = self.cursor.execute(query, params)
+                if not in_transaction:
+                    self.conn.commit()
+                return cursor
+
+            except Exception:
+                if not in_transaction:
+                    self.conn.rollback()
+                raise
+
+    def __scalar(self, query, params=()):
+        """Execute a single-value query and return the first column of the first row, or None."""
+
+        if self.debug:
+            _log.info('Attempting to execute: Query - %s Params - %s', query, params)
+        with self.__lock:
+            row = self.cursor.execute(query, params).fetchone()
+        return row[0] if row else None
+
+    def select_data(self, selection_items: tuple[str, ...], selection_where=None, where_params=(),
+                    as_dicts=False) -> tuple[list, bool]:
         """
         Select rows from the table.
 
         Args:
-            selection_items (tuple): Tuple of strings for columns to search.
-            selection_where (str, optional): WHERE clause to filter results.
+            selection_items (tuple): Tuple of column names to return, as defined in the INI file, or ('*',).
+            selection_where (str, optional): WHERE clause to filter results. May contain ? placeholders.
+            where_params (tuple, optional): Values bound to the placeholders in selection_where.
+            as_dicts (bool, optional): Return rows as dicts instead of sqlite3.Row objects.
 
         Returns:
-            tuple[list[dict], bool]: List of matching rows. Bool for if data search was successful.
+            tuple[list, bool]: List of matching rows. Rows are sqlite3.Row objects, which support
+                both index and column-name access. Bool for if data search was successful.
         """
 
-        columns = ', '.join(selection_items)
-        query = f'SELECT {columns} FROM {self.db_name}'
-        if selection_where:
-            query += f' WHERE {selection_where}'
         try:
-            data = self.__execute_query(query)
-            if self.debug: logging.info(data)
+            unknown = [item for item in selection_items if item != '*' and item.lower() not in self.__columns]
+            if unknown:
+                raise ValueError(f"Unknown column(s) for {self.db_name}: {', '.join(unknown)}")
+
+            query = _select_sql(self.db_name, tuple(selection_items), selection_where)
+            data = self.__execute_query(query, where_params, as_dicts=as_dicts)
+            if self.debug and _log.isEnabledFor(logging.DEBUG): _log.debug('%r', data)
             if data:
                 return data
             else:
                 return [], False
 
         except Exception as e:
-            self.conn.rollback()
-            if self.debug: logging.error(f'Select failed, rolled back. Error: {e}')
+            if self.debug: _log.error('Select failed. Error: %s', e)
             return [], False
 
-    def insert_data(self, query_columns: tuple[str, ...], query_values) -> tuple[str, bool]:
+    def insert_data(self, query_columns: tuple[str, ...], rows) -> tuple[str, bool]:
         """
-        Insert a new row into the table.
+        Insert one or more rows into the table.
 
         Args:
             query_columns (tuple): Column names for insertion.
-            query_values (tuple): Corresponding values to insert.
+            rows (tuple | list[tuple]): Values for a single row, or a list of value tuples
+                to insert as a batch within a single transaction.
 
         Returns:
             tuple[str, bool]: Success or failure message. Bool for success/failure
         """
 
-        columns = ', '.join(query_columns)
-
-        formatted_values = []
-        for value in query_values:
-            if isinstance(value, str):
-                formatted_values.append(f"'{value}'")
-            elif value is None:
-                formatted_values.append('NULL')
-            else:
-                formatted_values.append(str(value))
-
-        values = ', '.join(formatted_values)
-        query = f'INSERT INTO {self.db_name} ({columns}) VALUES ({values})'
+        if rows and not isinstance(rows[0], (list, tuple)):
+            rows = [rows]
 
         try:
-            self.__execute_query(query=query)
-            if self.debug: logging.info("Data inserted successfully.")
+            # Values are always bound as parameters; only the column names are interpolated.
+            columns = ', '.join(map(_sanitize_identifier, query_columns))
+            row_placeholders = f"({', '.join('?' * len(query_columns))})"
+            query = f'INSERT INTO {self.db_name} ({columns}) VALUES {row_placeholders}'
+
+            if self.debug:
+                _log.info('Attempting to execute: Query - %s Rows - %s', query, len(rows))
+
+            with self.__lock:
+                if self.conn.in_transaction:
+                    # A savepoint makes this call all-or-nothing without ending the enclosing transaction.
+                    self.cursor.execute('SAVEPOINT insert_data')
+                    try:
+                        self.__insert_rows(query, row_placeholders, len(query_columns), rows)
+                    except BaseException:
+                        self.cursor.execute('ROLLBACK TO insert_data')
+                        raise
+                    finally:
+                        self.cursor.execute('RELEASE insert_data')
+                else:
+                    with self.conn:
+                        self.__insert_rows(query, row_placeholders, len(query_columns), rows)
+            if self.debug: _log.info('Data inserted successfully.')
             return "Data inserted successfully.", True
 
         except Exception as e:
-            self.conn.rollback()
-            if self.debug: logging.error(f'Insertion failed, rolled back. Error: {e}')
+            if self.debug: _log.error('Insertion failed, rolled back. Error: %s', e)
             return f'Insertion failed, rolled back. Error: {e}', False
 
+    def __insert_rows(self, query, row_placeholders, column_count, rows):
+        """
+        Insert rows using multi-row VALUES statements of a fixed size, then executemany for the remainder.
+
+        The batch size is fixed per column count so both statements stay stable across calls and are
+        reused from the connection's prepared-statement cache.
+        """
+
+        if hasattr(self.conn, 'getlimit'):
+            max_variables = self.conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        else:
+            max_variables = _MAX_VARIABLES
+        batch_size = max(1, min(_MAX_ROWS_PER_INSERT, max_variables // column_count))
+        batched = len(rows) - len(rows) % batch_size
+
+        if batched and batch_size > 1:
+            # Flattening would shift values across rows of the wrong length; fail like executemany does.
+            for index, row in enumerate(rows[:batched]):
+                if len(row) != column_count:
+                    raise sqlite3.ProgrammingError(f'Incorrect number of bindings supplied for row {index}. '
+                                                   f'The statement uses {column_count}, '
+                                                   f'and there are {len(row)} supplied.')
+            batch_query = f"{query}{f', {row_placeholders}' * (batch_size - 1)}"
+            for start in range(0, batched, batch_size):
+                self.cursor.execute(batch_query, tuple(chain.from_iterable(rows[start:start + batch_size])))
+            rows = rows[batched:]
+
+        if rows:
+            self.cursor.executemany(query, rows)
+
     def delete_data(self, column_name: str, value_to_delete) -> tuple[str, bool]:
         """
         Delete rows matching a specific column value.
@@ -229,24 +565,24 @@ class SQLiteHelper:
             tuple[str, bool]: Success or failure message. Bool for success/failure
         """
 
-        query = f"DELETE FROM {self.db_name} WHERE {column_name} = ?"
         try:
-            self.__execute_query(query, (value_to_delete,))
-            if self.debug: logging.info("Data deleted successfully.")
+            query = f"DELETE FROM {self.db_name} WHERE {_sanitize_identifier(column_name)} = ?"
+            self.__exec(query, (value_to_delete,))
+            if self.debug: _log.info('Data deleted successfully.')
             return "Data deleted successfully", True
 
         except Exception as e:
-            self.conn.rollback()
-            if self.debug: logging.error(f'Deletion failed, rolled back. Error: {e}')
+            if self.debug: _log.error('Deletion failed, rolled back. Error: %s', e)
             return f'Deletion failed, rolled back. Error: {e}', False
 
-    def update_data(self, update_data_dictionaries: dict, where_clause: str) -> tuple[str, bool]:
+    def update_data(self, update_data_dictionaries: dict, where_clause: str, where_params=()) -> tuple[str, bool]:
         """
         Update rows in the table.
 
         Args:
             update_data_dictionaries (dict): Each dictionary maps column names to updated values.
-            where_clause (str): WHERE condition to match rows for update.
+            where_clause (str): WHERE condition to match rows for update. May contain ? placeholders.
+            where_params (tuple, optional): Values bound to the placeholders in where_clause.
 
         Returns:
             tuple[str, bool]: Success or failure message. Bool for success/failure
@@ -256,26 +592,15 @@ class SQLiteHelper:
         for dictionary in update_data_dictionaries:
             merged_dict.update(dictionary)
 
-        set_parts = []
-        for key, value in merged_dict.items():
-            if isinstance(value, str):
-                set_parts.append(f"{key}='{value}'")
-            elif value is None:
-                set_parts.append(f"{key}=NULL")
-            else:
-                set_parts.append(f"{key}={value}")
-
-        set_clause = ', '.join(set_parts)
-
-        query = f"UPDATE {self.db_name} SET {set_clause} WHERE {where_clause}"
         try:
-            self.__execute_query(query)
-            if self.debug: logging.info("Data updated successfully.")
+            set_clause = ', '.join(f'{_sanitize_identifier(key)}=?' for key in merged_dict)
+            query = f"UPDATE {self.db_name} SET {set_clause} WHERE {where_clause}"
+            self.__exec(query, (*merged_dict.values(), *where_params))
+            if self.debug: _log.info('Data updated successfully.')
             return "Data updated successfully.", True
 
         except Exception as e:
-            self.conn.rollback()
-            if self.debug: logging.error(f'Update failed, rolled back. Error: {e}')
+            if self.debug: _log.error('Update failed, rolled back. Error: %s', e)
             return f'Update failed, rolled back. Error: {e}', False
 
     def select_min(self, column_name: str) -> tuple[str, bool]:
@@ -289,17 +614,16 @@ class SQLiteHelper:
             tuple[str, bool]: Success or failure message. Bool for success/failure
         """
 
-        query = f"SELECT MIN({column_name}) FROM {self.db_name}"
+        query = _compile('min', self.db_name, column_name)
 
         try:
-            data = self.__execute_query(query)
-            if self.debug: logging.info(f"Minimum from {column_name}: {data}.")
+            data = self.__scalar(query)
+            if self.debug: _log.info('Minimum from %s: %s.', column_name, data)
             return f"Minimum from {column_name}: {data}.", True
 
         except Exception as e:
-            self.conn.rollback()
-            if self.debug: logging.error(f'Selection failed, rolled back. Error: {e}')
-            return f'Selection failed, rolled back. Error: {e}', False
+            if self.debug: _log.error('Selection failed. Error: %s', e)
+            return f'Selection failed. Error: {e}', False
 
     def select_max(self, column_name: str) -> tuple[str, bool]:
         """
@@ -312,16 +636,15 @@ class SQLiteHelper:
             tuple[str, bool]: Success or failure message. Bool for success/failure
         """
 
-        query = f"SELECT MAX({column_name}) FROM {self.db_name}"
+        query = _compile('max', self.db_name, column_name)
         try:
-            data = self.__execute_query(query)
-            if self.debug: logging.info(f"Maximum from {column_name}: {data}.")
+            data = self.__scalar(query)
+            if self.debug: _log.info('Maximum from %s: %s.', column_name, data)
             return f"Maximum from {column_name}: {data}.", True
 
         except Exception as e:
-            self.conn.rollback()
-            if self.debug: logging.error(f'Selection failed, rolled back. Error: {e}')
-            return f'Selection failed, rolled back. Error: {e}', False
+            if self.debug: _log.error('Selection failed. Error: %s', e)
+            return f'Selection failed. Error: {e}', False
 
     def select_avg(self, column_name: str):
         """
@@ -334,32 +657,53 @@ class SQLiteHelper:
             tuple[str, bool]: Success or failure message. Bool for success/failure
         """
 
-        query = f"SELECT AVG({column_name}) FROM {self.db_name}"
+        query = _compile('avg', self.db_name, column_name)
         try:
-            data = self.__execute_query(query)
-            if self.debug: logging.info(f"Average from {column_name}: {data}.")
+            data = self.__scalar(query)
+            if self.debug: _log.info('Average from %s: %s.', column_name, data)
             return f"Average from {column_name}: {data}.", True
 
         except Exception as e:
-            self.conn.rollback()
-            if self.debug: logging.error(f'Selection failed, rolled back. Error: {e}')
-            return f'Selection failed, rolled back. Error: {e}', False
+            if self.debug: _log.error('Selection failed. Error: %s', e)
+            return f'Selection failed. Error: {e}', False
 
-    def count(self, where_clause: str=None):
+    def analyze(self) -> tuple[str, bool]:
+        """
+        Gather table and index statistics so the query planner can choose better plans.
+
+        Returns:
+            tuple[str, bool]: Success or failure message. Bool for success/failure
+        """
+
+        try:
+            self.__exec(f'ANALYZE {self.db_name}')
+            if self.debug: _log.info('Table analyzed successfully.')
+            return "Table analyzed successfully.", True
+
+        except Exception as e:
+            if self.debug: _log.error('Analyze failed. Error: %s', e)
+            return f'Analyze failed. Error: {e}', False
+
+    def count(self, where_clause: str=None, where_params=()):
         """
         Count the number of rows in the table.
 
         Args:
             where_clause (str, optional): An optional SQL WHERE clause (without the 'WHERE' keyword)
-                to filter the rows being counted. For example: "age > 30".
+                to filter the rows being counted. For example: "age > 30", or "age > ?" with where_params.
+            where_params (tuple, optional): Values bound to the placeholders in where_clause.
 
         Returns:
             int: The number of rows matching the condition. If no condition is provided,
                  returns the total number of rows in the table.
         """
 
-        query = f"SELECT COUNT(*) as total FROM {self.db_name}"
+        query = _compile('count', self.db_name)
         if where_clause:
             query += f" WHERE {where_clause}"
-        data = self.__execute_query(query)
-        return data[0][0]['total'] if data else 0
+        try:
+            return self.__scalar(query, where_params) or 0
+
+        except Exception as e:
+            if self.debug: _log.error('Count failed. Error: %s', e)
+            return 0